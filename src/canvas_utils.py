@@ -40,6 +40,11 @@ class Picture:
         self.width: int = width if width is not None else self.image.size[0]
         self.height: int = height if height is not None else self.image.size[1]
         
+        # Resized RGBA copy of the image, rotations are applied on top of it.
+        # Built on first use by generate_photo, so subclasses supplying their
+        # own photos never pay for it.
+        self._base: Image.Image = None
+        
         # Generate initial PhotoImage
         self.photo_image = self.generate_photo()
     
@@ -57,12 +62,13 @@ class Picture:
         """Update the displayed photo with new size or rotation.
         
         Args:
-            resize: Tuple of (width, height) for new size
-            angle: New absolute angle
+            resize: Tuple of (width, height) for new size (None = no change)
+            angle: New absolute angle, a number (None = no change)
         """
-        if isinstance(resize, tuple):
+        if resize is not None and resize != (self.width, self.height):
             self.width, self.height = resize
-        if isinstance(angle, (int, float)):
+            self._base = None
+        if angle is not None:
             self.angle = angle
         
         self.photo_image = self.generate_photo()
@@ -75,10 +81,21 @@ class Picture:
         Returns:
             PhotoImage object ready for Tkinter
         """
+        if self._base is None:
+            self._base = self._resized_base()
+        if self.angle % 360 == 0:
+            return ImageTk.PhotoImage(self._base)
         # Rotate counter-clockwise (Tkinter convention)
-        rotated = self.image.rotate(360 - self.angle)
-        resized = rotated.resize((self.width, self.height))
-        return ImageTk.PhotoImage(resized.convert("RGBA"))
+        return ImageTk.PhotoImage(self._base.rotate(360 - self.angle))
+    
+    def _resized_base(self) -> Image.Image:
+        """Resize the source image to the current dimensions.
+        
+        Returns:
+            RGBA image of size (width, height)
+        """
+        resized = self.image.resize((self.width, self.height))
+        return resized if resized.mode == "RGBA" else resized.convert("RGBA")
     
     def resize(self, width: int, height: int):
         """Resize the image (absolute).
@@ -122,15 +139,15 @@ class Picture:
         """Get or set coordinates (absolute).
         
         Args:
-            x1: New X coordinate (None = no change)
-            y1: New Y coordinate (None = no change)
+            x1: New X coordinate, a number (None = no change)
+            y1: New Y coordinate, a number (None = no change)
             
         Returns:
             Current coordinates as tuple
         """
-        if isinstance(x1, (int, float)):
+        if x1 is not None:
             self.x1 = x1
-        if isinstance(y1, (int, float)):
+        if y1 is not None:
             self.y1 = y1
         
         if x1 is None and y1 is None:
@@ -142,15 +159,15 @@ class Picture:
         """Move by relative offset.
         
         Args:
-            _x1: X offset to add
-            _y1: Y offset to add
+            _x1: X offset to add, a number (None = no change)
+            _y1: Y offset to add, a number (None = no change)
             
         Returns:
             Current coordinates
         """
-        if isinstance(_x1, (int, float)):
+        if _x1 is not None:
             self.x1 += _x1
-        if isinstance(_y1, (int, float)):
+        if _y1 is not None:
             self.y1 += _y1
         
         return self.coords(x1=self.x1, y1=self.y1)
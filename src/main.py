@@ -3,9 +3,58 @@
 Uses Tkinter's after() method instead of threading for proper GUI updates.
 """
 from canvas_utils import Picture
-from PIL import Image, ImageTk
-from tkinter import Tk, Canvas, PhotoImage, Button, CENTER
+from PIL import Image, ImageDraw, ImageTk
+from tkinter import Tk, Canvas, PhotoImage, Button, CENTER, NW
+from collections import deque
 import random
+import time
+
+
+# Decoded and resized apple sprites, keyed by cell size
+_APPLE_CACHE: dict[tuple, Image.Image] = {}
+
+# Movement vectors (col, row) for each direction
+_DIRECTION_VECTORS: dict[int, tuple[int, int]] = {
+    90: (1, 0),    # Right
+    180: (0, 1),   # Down
+    270: (-1, 0),  # Left
+    360: (0, -1)   # Up
+}
+
+
+def step_snake(cells: deque, directions: deque, occupied: set, next_direction: int,
+               all_cells: frozenset, apple_cell: tuple, 
+               self_collision: bool = True) -> tuple[bool, bool]:
+    """Advance the snake state by one cell, without touching the canvas.
+    
+    The new head is pushed onto `cells` and `directions` and marked in
+    `occupied`. The tail is dropped unless the snake died or ate the apple.
+    
+    Args:
+        cells: Snake (col, row) cells, head first
+        directions: Direction of each cell, head first
+        occupied: Set of (col, row) cells covered by the snake
+        next_direction: Direction of the move (90, 180, 270, 360)
+        all_cells: Every cell of the board
+        apple_cell: Apple position (col, row)
+        self_collision: Whether running into the snake is fatal (off in cheat mode)
+        
+    Returns:
+        Tuple of (alive, ate_apple)
+    """
+    d_col, d_row = _DIRECTION_VECTORS[next_direction]
+    head = (cells[0][0] + d_col, cells[0][1] + d_row)
+    alive = head in all_cells and not (self_collision and head in occupied)
+    ate_apple = head == apple_cell
+    
+    directions.appendleft(next_direction)
+    cells.appendleft(head)
+    occupied.add(head)
+    
+    if alive and not ate_apple:
+        occupied.discard(cells.pop())
+        directions.pop()
+    return alive, ate_apple
 
 
 class SnakeBody(Picture):
@@ -18,9 +67,21 @@ class SnakeBody(Picture):
             snake: Parent Snake object
             _type: Type of segment ('head_image' or 'body_image')
         """
-        super().__init__(*args, **kwargs)
+        # Set before Picture.__init__, which generates the first photo
         self.snake: 'Snake' = snake
         self.type = _type
+        super().__init__(*args, **kwargs)
+    
+    def generate_photo(self) -> ImageTk.PhotoImage:
+        """Get the PhotoImage for the current angle from the snake's cache.
+        
+        Segments never allocate their own PhotoImage, so the number of live
+        images stays bounded however long the game runs.
+        
+        Returns:
+            Cached PhotoImage (sized by the parent Snake)
+        """
+        return self.snake.rotated_photo(self.type, int(self.angle % 360))
     
     def set_angle(self, angle: int):
         """Set absolute rotation angle using pre-cached images.
@@ -33,7 +94,11 @@ class SnakeBody(Picture):
         """
         self.angle = int(angle % 360)
         # Use pre-cached rotated images for performance
-        self.photo_image = self.snake.rotated_photo_images[self.type][self.angle]
+        photo_image = self.snake.rotated_photo(self.type, self.angle)
+        # Same cached image already displayed, skip the Tk round-trip
+        if photo_image is self.photo_image:
+            return self
+        self.photo_image = photo_image
         if self.id is not None:
             self.master.itemconfigure(self.id, image=self.photo_image)
         return self
@@ -51,13 +116,14 @@ class Apple(Picture):
         """
         self.game: 'Game' = game
         self.master: Board = self.game.board
-        self.cell_position: list = [0, 0]  # Store current cell position [col, row]
+        self.cell_position: tuple = (0, 0)  # Store current cell position (col, row)
         
         if image is None:
-            image = Image.open("../assets/apple.gif").resize(
-                (self.master.width // self.master.ncols, 
-                 self.master.height // self.master.nrows)
-            )
+            size = (self.master.width // self.master.ncols, 
+                    self.master.height // self.master.nrows)
+            image = _APPLE_CACHE.get(size)
+            if image is None:
+                image = _APPLE_CACHE[size] = Image.open("../assets/apple.gif").convert("RGBA").resize(size)
         
         super().__init__(master=self.master, image=image, *args, **kwargs)
     
@@ -75,15 +141,29 @@ class Apple(Picture):
         coords = self.master.get_coords(col=self.cell_position[0], row=self.cell_position[1])
         self.coords(*coords)
     
-    def random_cell(self):
-        """Get random free cell position.
+    def random_cell(self, attempts: int = 16):
+        """Get random cell position not occupied by the snake.
+        
+        Draws random cells until a free one comes up, which takes about one
+        draw until the board is nearly full; after `attempts` misses it picks
+        among the remaining free cells instead.
         
+        Args:
+            attempts: Number of random draws before falling back
+            
         Returns:
-            List of [col, row]
+            Tuple of (col, row)
         """
-        if self.master.free_cells:
-            return random.choice(self.master.free_cells).copy()
-        return [1, 1]
+        occupied = self.game.snake.snake_cell_set
+        for _ in range(attempts):
+            cell = (random.randint(1, self.master.ncols), random.randint(1, self.master.nrows))
+            if cell not in occupied:
+                return cell
+        
+        free_cells = self.master.all_cells - occupied
+        if free_cells:
+            return random.choice(tuple(free_cells))
+        return (1, 1)
 
 
 class Board(Canvas):
@@ -107,39 +187,33 @@ class Board(Canvas):
         self.nrows, self.ncols = nrows, ncols
         self.width, self.height = width, height
         self.game: 'Game' = game
-        self.free_cells: list = []
-        
-        # Create checkerboard pattern
-        self.cells_id = [
-            [
-                self.create_rectangle(
-                    (width / ncols * (col - 1),
-                     height / nrows * (row - 1),
-                     width / ncols * col,
-                     height / nrows * row),
-                    fill="#8BF52D" if (row + col) % 2 == 0 else "#6EBD28",
-                    outline=""
-                ) 
-                for col in range(1, ncols + 1)
-            ] 
-            for row in range(1, nrows + 1)
-        ]
-    
-    def update_free_cells(self):
-        """Update list of cells not occupied by snake.
+        self.all_cells: frozenset = frozenset(
+            (col, row) for col in range(1, ncols + 1) for row in range(1, nrows + 1)
+        )
         
-        Returns:
-            List of free [col, row] positions
-        """
-        self.free_cells = [
-            [i, j] 
-            for i in range(1, self.ncols + 1) 
-            for j in range(1, self.nrows + 1) 
-            if not hasattr(self.game, "snake") 
-               or not hasattr(self.game.snake, "cells") 
-               or [i, j] not in self.game.snake.cells
-        ]
-        return self.free_cells
+        # Precompute pixel centers, indexed as coords_table[col][row]
+        self.coords_table: list[list] = [[None] * (nrows + 2) for _ in range(ncols + 2)]
+        for col in range(1, ncols + 1):
+            for row in range(1, nrows + 1):
+                self.coords_table[col][row] = (
+                    int(width / (ncols * 2) + (col - 1) * width / ncols),
+                    int(height / (nrows * 2) + (row - 1) * height / nrows)
+                )
+        
+        # Render the checkerboard once and show it as a single canvas item
+        background = Image.new("RGB", (width, height))
+        draw = ImageDraw.Draw(background)
+        for row in range(1, nrows + 1):
+            for col in range(1, ncols + 1):
+                draw.rectangle(
+                    (round(width / ncols * (col - 1)),
+                     round(height / nrows * (row - 1)),
+                     round(width / ncols * col) - 1,
+                     round(height / nrows * row) - 1),
+                    fill="#8BF52D" if (row + col) % 2 == 0 else "#6EBD28"
+                )
+        self.background_photo: ImageTk.PhotoImage = ImageTk.PhotoImage(background)
+        self.background_id: int = self.create_image(0, 0, anchor=NW, image=self.background_photo)
     
     def get_coords(self, col, row):
         """Convert cell position to pixel coordinates.
@@ -151,10 +225,7 @@ class Board(Canvas):
         Returns:
             Tuple of (x, y) pixel coordinates (center of cell)
         """
-        col_idx, row_idx = col - 1, row - 1
-        x = int(self.width / (self.ncols * 2) + col_idx * self.width / self.ncols)
-        y = int(self.height / (self.nrows * 2) + row_idx * self.height / self.nrows)
-        return x, y
+        return self.coords_table[col][row]
     
     def get_cell(self, coords):
         """Convert pixel coordinates to cell position.
@@ -274,6 +345,8 @@ class Game:
         if not self.game_running:
             return
         
+        tick_start = time.perf_counter()
+        
         # Advance snake by one step
         still_alive = self.snake.advance()
         
@@ -284,8 +357,9 @@ class Game:
             min_delay = 50
             speed_delay = max(min_delay, base_delay - (self.score * 5))
             
-            # Schedule next iteration
-            self.after_id = self.master.after(speed_delay, self._game_loop)
+            # Schedule next iteration, minus the time this tick already took
+            elapsed_ms = int((time.perf_counter() - tick_start) * 1000)
+            self.after_id = self.master.after(max(1, speed_delay - elapsed_ms), self._game_loop)
         else:
             # Game over
             self.game_running = False
@@ -346,6 +420,9 @@ class Game:
 class Snake:
     """Snake object with movement and collision detection."""
     
+    # Decoded and resized sprites, keyed by (path, width, height)
+    _IMAGE_CACHE: dict[tuple, Image.Image] = {}
+    
     def __init__(self, head_image, body_image, game: Game, 
                  cell1: tuple[int, int] = None, cell2: tuple[int, int] = None, 
                  *args, **kwargs):
@@ -359,26 +436,41 @@ class Snake:
             cell2: Starting tail position
         """
         self.length: int = 0
-        self.cells: list[list] = []
-        self.directions: list[int] = []
+        self.cells: deque[tuple] = deque()
+        self.snake_cell_set: set[tuple] = set()
+        self.directions: deque[int] = deque()
         self.alive: bool = True
+        self.cheat_mode: bool = False
         self.game: Game = game
         self.master: Board = self.game.board
+        # Bound once, advance places segments without the Picture wrappers
+        self._canvas_coords = self.master.coords
         
         # Initialize position
         self.init(cell1, cell2)
         
         # Load and resize images
+        cell_width = int(self.master.width / self.master.ncols)
+        cell_height = int(self.master.height / self.master.nrows)
+        
         def load_image(img):
             if isinstance(img, Image.Image):
-                return img
-            return Image.open(img)
+                return img.convert("RGBA").resize((cell_width, cell_height))
+            key = (img, cell_width, cell_height)
+            if key not in Snake._IMAGE_CACHE:
+                Snake._IMAGE_CACHE[key] = Image.open(img).convert("RGBA").resize((cell_width, cell_height))
+            return Snake._IMAGE_CACHE[key]
         
-        cell_width = int(self.master.width / self.master.ncols)
-        cell_height = int(self.master.height / self.master.nrows)
+        self.head_image = load_image(head_image)
+        self.body_image = load_image(body_image)
         
-        self.head_image = load_image(head_image).convert("RGBA").resize((cell_width, cell_height))
-        self.body_image = load_image(body_image).convert("RGBA").resize((cell_width, cell_height))
+        # Pre-cache rotated images for the four directions, keyed by angle % 360
+        self.rotated_photo_images: dict = {
+            "head_image": {angle % 360: ImageTk.PhotoImage(self.head_image.rotate(360 - angle)) 
+                          for angle in (90, 180, 270, 360)},
+            "body_image": {angle % 360: ImageTk.PhotoImage(self.body_image.rotate(360 - angle)) 
+                          for angle in (90, 180, 270, 360)}
+        }
         
         # Create body segments
         self.body = [
@@ -387,14 +479,6 @@ class Snake:
               for _ in range(self.length - 1)]
         ]
         
-        # Pre-cache rotated images for performance
-        self.rotated_photo_images: dict = {
-            "head_image": [ImageTk.PhotoImage(self.head_image.rotate(360 - angle)) 
-                          for angle in range(360)],
-            "body_image": [ImageTk.PhotoImage(self.body_image.rotate(360 - angle)) 
-                          for angle in range(360)]
-        }
-        
         self.next_direction: int = self.directions[0]
         
         # Bind arrow keys
@@ -408,9 +492,26 @@ class Snake:
             self.activate_cheat()
         
         # Store original methods for cheat toggle
-        self._original_update_free_cells = self.master.update_free_cells
         self._original_set_next_direction = self._set_next_direction_impl
     
+    def rotated_photo(self, _type: str, angle: int) -> ImageTk.PhotoImage:
+        """Get the pre-cached rotated PhotoImage for a direction.
+        
+        Args:
+            _type: Type of segment ('head_image' or 'body_image')
+            angle: Rotation angle (0, 90, 180 or 270)
+            
+        Returns:
+            PhotoImage for the given type and angle
+            
+        Raises:
+            ValueError: If angle is not one of the four directions
+        """
+        photos = self.rotated_photo_images[_type]
+        if angle not in photos:
+            raise ValueError(f"Unsupported snake angle: {angle} (expected 0, 90, 180 or 270)")
+        return photos[angle]
+    
     def _set_next_direction_impl(self, angle) -> bool:
         """Internal implementation of direction setting with validation.
         
@@ -427,26 +528,19 @@ class Snake:
     
     def activate_cheat(self):
         """Enable cheat mode (no collision, allow reverse)."""
-        # Override free_cells to include all cells
-        def cheat_update_free_cells():
-            self.master.free_cells = [
-                [i, j] 
-                for i in range(1, self.master.ncols + 1) 
-                for j in range(1, self.master.nrows + 1)
-            ]
-            return self.master.free_cells
-        
         # Override direction setting to allow all directions
         def cheat_set_next_direction(angle):
             self.next_direction = angle
             return True
         
-        self.master.update_free_cells = cheat_update_free_cells
+        self.cheat_mode = True
         self.set_next_direction = cheat_set_next_direction
     
     def deactivate_cheat(self):
         """Disable cheat mode (restore normal rules)."""
-        self.master.update_free_cells = self._original_update_free_cells
+        # The snake may have crossed itself while in cheat mode
+        self.snake_cell_set = set(self.cells)
+        self.cheat_mode = False
         self.set_next_direction = self._original_set_next_direction
     
     def set_next_direction(self, angle) -> bool:
@@ -481,22 +575,16 @@ class Snake:
         self.length = max(abs(dx), abs(dy))
         
         # Generate cell positions
-        self.cells = [
-            [
+        self.cells = deque([
+            (
                 cell1[0] - i if dx != 0 else cell1[0],
                 cell1[1] - i if dy != 0 else cell1[1]
-            ]
+            )
             for i in range(self.length)
-        ]
+        ])
         
-        # Update free cells early to prevent apple spawn on snake
-        self.master.free_cells = [
-            [i, j] 
-            for i in range(1, self.master.ncols + 1) 
-            for j in range(1, self.master.nrows + 1) 
-            if [i, j] not in self.cells
-        ]
-        self.master.update_free_cells()
+        # Occupied cells, used for collisions and apple placement
+        self.snake_cell_set = set(self.cells)
         
         # Determine initial direction
         def get_direction():
@@ -514,7 +602,7 @@ class Snake:
             return 90  # Default right
         
         initial_direction = get_direction()
-        self.directions = [initial_direction] * self.length
+        self.directions = deque([initial_direction] * self.length)
     
     def advance(self):
         """Advance snake one step in current direction.
@@ -522,79 +610,44 @@ class Snake:
         Returns:
             True if snake is still alive, False if game over
         """
-        speed = 5  # Number of animation frames
-        
-        # Movement vectors for each direction
-        direction_vectors = {
-            90: (1, 0),    # Right
-            180: (0, 1),   # Down
-            270: (-1, 0),  # Left
-            360: (0, -1)   # Up
-        }
-        
-        # Update direction and position
-        self.directions.insert(0, self.next_direction)
-        new_col = self.cells[0][0] + direction_vectors[self.next_direction][0]
-        new_row = self.cells[0][1] + direction_vectors[self.next_direction][1]
-        self.cells.insert(0, [new_col, new_row])
-        
-        # Check collision
-        if self.cells[0] not in self.master.free_cells:
-            self.alive = False
+        cells, directions = self.cells, self.directions
+        get_coords, canvas_coords = self.master.get_coords, self._canvas_coords
+        
+        # Game logic first, the canvas is only updated afterwards
+        self.alive, ate_apple = step_snake(
+            cells, directions, self.snake_cell_set, self.next_direction,
+            self.master.all_cells, self.game.apple.cell_position, 
+            self_collision=not self.cheat_mode
+        )
         
-        # Check if apple eaten - use stored cell position for accurate detection
         new_body = None
-        if list(self.cells[0]) == list(self.game.apple.cell_position):
+        if ate_apple:
             self.game.add_score()
             new_body = self.create_body()
             # Get coordinates of the last cell (tail position)
-            tail_col, tail_row = self.cells[-1]
-            x1, y1 = self.master.get_coords(col=tail_col, row=tail_row)
+            tail_col, tail_row = cells[-1]
+            x1, y1 = get_coords(tail_col, tail_row)
             new_body.show(x1=x1, y1=y1)
         
-        # Animate movement
-        for i in range(1, speed + 1):
-            for j, snake_body in enumerate(self.body):
-                if not self.alive:
-                    if i == speed or snake_body.angle == self.directions[j]:
-                        return self.alive
-                    else:
-                        # Death animation for head
-                        if j == 0:
-                            angle_diff = self.directions[j] - snake_body.angle
-                            snake_body.pivotate(int(angle_diff / speed))
-                        continue
-                
-                # Rotate body segment if needed
-                if snake_body.angle != self.directions[j]:
-                    angle_diff = self.directions[j] - snake_body.angle
-                    # Handle wrap-around
-                    if angle_diff > 180:
-                        angle_diff -= 360
-                    elif angle_diff < -180:
-                        angle_diff += 360
-                    snake_body.pivotate(int(angle_diff / speed))
-                
-                # Move to new position
-                curr_x, curr_y = self.master.get_coords(col=self.cells[j][0], row=self.cells[j][1])
-                prev_x, prev_y = self.master.get_coords(col=self.cells[j + 1][0], row=self.cells[j + 1][1])
-                
-                # Interpolate position
-                x1 = int(prev_x + i / speed * (curr_x - prev_x))
-                y1 = int(prev_y + i / speed * (curr_y - prev_y))
-                snake_body.coords(x1, y1)
-        
-        # Update state
-        self.master.update_free_cells()
+        # Dead: turn the head towards the fatal direction and stop there
+        if not self.alive:
+            self.body[0].set_angle(directions[0])
+            return self.alive
+        
+        # Snap each segment to its new cell (intermediate frames computed in a
+        # single callback are never drawn, Tk only redraws once it is idle)
+        for snake_body, cell, direction in zip(self.body, cells, directions):
+            # Segment angles are kept modulo 360, "up" is direction 360
+            if snake_body.angle != direction % 360:
+                snake_body.set_angle(direction)
+            x1, y1 = get_coords(cell[0], cell[1])
+            canvas_coords(snake_body.id, x1, y1)
+            snake_body.x1, snake_body.y1 = x1, y1
         
         if new_body is not None:
             # Grew by eating apple
             self.body.append(new_body)
             self.length += 1
-        else:
-            # Remove tail
-            self.directions = self.directions[:-1]
-            self.cells = self.cells[:-1]
         
         return self.alive
     
@@ -612,9 +665,7 @@ class Snake:
         """Display all snake segments on the board."""
         for snake_body, cell, angle in zip(self.body, self.cells, self.directions):
             x1, y1 = self.master.get_coords(col=cell[0], row=cell[1])
-            snake_body.photo_image = ImageTk.PhotoImage(
-                snake_body.image.rotate(360 - angle).convert("RGBA")
-            )
+            snake_body.set_angle(angle)
             snake_body.show(x1=x1, y1=y1)
     
     def delete(self):